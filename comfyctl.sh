@@ -15,6 +15,7 @@ COMFYUI_DIR="${SCRIPT_DIR}/ComfyUI"
 WORKFLOW_DIR="${COMFYUI_DIR}/venv/lib/python3.12/site-packages/comfyui_workflow_templates/templates"
 OUTPUT_DIR="${COMFYUI_DIR}/output"
 VENV_PATH="${COMFYUI_DIR}/venv/bin/activate"
+VENV_PYTHON="${COMFYUI_DIR}/venv/bin/python"
 
 # Default parameters (Node IDs from flux-kontext workflow)
 DEFAULT_SEED="randomize"
@@ -25,48 +26,126 @@ DEFAULT_PROMPT=""        # Node ID 3
 DEFAULT_WIDTH=1024
 DEFAULT_HEIGHT=1024
 
+# Required model files (resolved once, shared by check/install)
+FLUX_KONTEXT_MODEL="${COMFYUI_DIR}/models/diffusion_models/flux1-dev-kontext_fp8_scaled.safetensors"
+CLIP_L_MODEL="${COMFYUI_DIR}/models/text_encoders/clip_l.safetensors"
+T5XXL_MODEL="${COMFYUI_DIR}/models/text_encoders/t5xxl_fp8_e4m3fn_scaled.safetensors"
+VAE_MODEL="${COMFYUI_DIR}/models/vae/ae.safetensors"
+REQUIRED_MODELS=("${FLUX_KONTEXT_MODEL}" "${CLIP_L_MODEL}" "${T5XXL_MODEL}" "${VAE_MODEL}")
+
+# Smoke-test prompts for European supermodel generation
+SMOKE_TEST_PROMPTS=(
+    "Professional headshot of a European supermodel, studio lighting"
+    "Portrait photography, elegant pose, soft natural lighting"
+    "High fashion model, editorial style, minimalist background"
+)
+
+# Ollama prompt optimization (talks to the running daemon over its HTTP API).
+# Defaults to OLLAMA_HOST, parsed like the ollama CLI does: http:// and port 11434 unless
+# given, and an empty or bind-all (0.0.0.0) host means the local daemon.
+# OLLAMA_API_URL overrides it.
+_ollama_addr="${OLLAMA_API_URL:-${OLLAMA_HOST:-}}"
+_ollama_scheme="http"
+if [[ "${_ollama_addr}" == *://* ]]; then
+    _ollama_scheme="${_ollama_addr%%://*}"
+    _ollama_addr="${_ollama_addr#*://}"
+fi
+_ollama_addr="${_ollama_addr%%/*}"
+if [[ "${_ollama_addr}" =~ ^(.*):([0-9]+)$ ]]; then
+    _ollama_host="${BASH_REMATCH[1]}" _ollama_port=":${BASH_REMATCH[2]}"
+else
+    _ollama_host="${_ollama_addr}" _ollama_port=""
+    # An explicit scheme keeps its own default port, as in the ollama CLI
+    [[ "${OLLAMA_API_URL:-${OLLAMA_HOST:-}}" == *://* ]] || _ollama_port=":11434"
+fi
+case "${_ollama_host}" in
+    ""|0.0.0.0|"[::]") _ollama_host="127.0.0.1" ;;
+esac
+OLLAMA_API_URL="${_ollama_scheme}://${_ollama_host}${_ollama_port}"
+unset _ollama_addr _ollama_scheme _ollama_host _ollama_port
+OLLAMA_MODEL="mistral"
+OLLAMA_SYSTEM_PROMPT="You are an expert prompt engineer for AI image generation models, specifically optimized for Flux.1-Kontext-Dev for creating European supermodel portraits.
+
+Transform the user's prompt to follow best practices:
+1. Be specific about facial features, lighting, and composition
+2. Include technical photography terms for professional quality
+3. Optimize for European supermodel aesthetic
+4. Keep the prompt focused and efficient for the model
+5. Maintain the original intent while enhancing detail
+
+Return ONLY the optimized prompt, no explanations."
+
 # Workflow templates
 FLUX_KONTEXT_BASIC="flux_kontext_dev_basic.json"
 FLUX_KONTEXT_MULTI="api_bfl_flux_1_kontext_multiple_images_input.json"
 
-# Colors for output
-RED='\033[0;31m'
-GREEN='\033[0;32m'
-YELLOW='\033[1;33m'
-BLUE='\033[0;34m'
-NC='\033[0m' # No Color
+# jq program applied to the flux-kontext template; only the per-run widget values vary
+WORKFLOW_PATCH_FILTER='
+    # Prompt (Node 6 - CLIPTextEncode)
+    (.nodes[] | select(.id == 6) | .widgets_values[0]) = $prompt
+    # CFG (Node 35 - FluxGuidance)
+    | (.nodes[] | select(.id == 35) | .widgets_values[0]) = ($cfg | tonumber)
+    # Seed and steps (Node 31 - KSampler)
+    | (.nodes[] | select(.id == 31) | .widgets_values) |= (
+        .[2] = ($steps | tonumber)
+        | if $seed == "randomize" then .[1] = "randomize"
+          else .[0] = ($seed | tonumber) | .[1] = "fixed" end)
+'
+
+# Colors for output (ANSI-C quoted so escapes are resolved once, not per message).
+# Disabled when stdout is not a terminal or NO_COLOR is set.
+if [[ -t 1 && -z "${NO_COLOR:-}" ]]; then
+    RED=$'\033[0;31m'
+    GREEN=$'\033[0;32m'
+    YELLOW=$'\033[1;33m'
+    BLUE=$'\033[0;34m'
+    NC=$'\033[0m' # No Color
+else
+    RED='' GREEN='' YELLOW='' BLUE='' NC=''
+fi
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
 log() {
-    echo -e "${GREEN}[$(date +'%Y-%m-%d %H:%M:%S')] $1${NC}"
+    local timestamp
+    printf -v timestamp '%(%Y-%m-%d %H:%M:%S)T' -1  # builtin, no date(1) fork per line
+    printf '%s\n' "${GREEN}[${timestamp}] $1${NC}"
 }
 
 warn() {
-    echo -e "${YELLOW}[WARNING] $1${NC}"
+    printf '%s\n' "${YELLOW}[WARNING] $1${NC}"
 }
 
 error() {
-    echo -e "${RED}[ERROR] $1${NC}"
+    printf '%s\n' "${RED}[ERROR] $1${NC}"
     exit 1
 }
 
 check_dependencies() {
+    local want_ollama="${1:-false}"
+    
     log "🔍 Checking dependencies..."
     
     if ! command -v python3 &> /dev/null; then
         error "Python3 not found. Please install Python 3.8+."
     fi
     
-    if ! command -v ollama &> /dev/null; then
-        warn "Ollama not found. Install with: curl -fsSL https://ollama.ai/install.sh | sh"
-        warn "Prompt optimization will be disabled."
-        OLLAMA_AVAILABLE=false
-    else
-        OLLAMA_AVAILABLE=true
-        log "✅ Ollama found"
+    # Ollama is only needed when prompt optimization was requested (--ollama).
+    # curl + jq reach the daemon (local or remote) over HTTP; the ollama CLI is the fallback.
+    OLLAMA_AVAILABLE=false
+    if [[ "${want_ollama}" == true ]]; then
+        if command -v curl &> /dev/null && command -v jq &> /dev/null; then
+            OLLAMA_AVAILABLE=true
+            log "✅ Ollama API client found (curl + jq, ${OLLAMA_API_URL})"
+        elif command -v ollama &> /dev/null; then
+            OLLAMA_AVAILABLE=true
+            log "✅ Ollama found"
+        else
+            warn "Neither curl + jq nor the ollama CLI found. Install Ollama with: curl -fsSL https://ollama.ai/install.sh | sh"
+            warn "--ollama requested, but prompt optimization will be skipped."
+        fi
     fi
     
     if [[ ! -f "${VENV_PATH}" ]]; then
@@ -85,6 +164,13 @@ activate_venv() {
     source "${VENV_PATH}"
 }
 
+# Print "<mtime> <path>" for every generated image, from a single directory walk.
+# Callers reduce this one listing instead of re-scanning OUTPUT_DIR.
+list_outputs() {
+    [[ -d "${OUTPUT_DIR}" ]] || return 0
+    find "${OUTPUT_DIR}" -type f \( -name "*.png" -o -name "*.jpg" -o -name "*.webp" \) -printf '%T@ %p\n' 2>/dev/null
+}
+
 # ============================================================================
 # OLLAMA INTEGRATION
 # ============================================================================
@@ -97,32 +183,29 @@ optimize_prompt_with_ollama() {
         return
     fi
     
-    log "🧠 Optimizing prompt with Ollama (Mistral)..."
+    log "🧠 Optimizing prompt with Ollama (Mistral)..." >&2
     
-    local system_prompt="You are an expert prompt engineer for AI image generation models, specifically optimized for Flux.1-Kontext-Dev for creating European supermodel portraits. 
-
-Transform the user's prompt to follow best practices:
-1. Be specific about facial features, lighting, and composition
-2. Include technical photography terms for professional quality
-3. Optimize for European supermodel aesthetic
-4. Keep the prompt focused and efficient for the model
-5. Maintain the original intent while enhancing detail
-
-Return ONLY the optimized prompt, no explanations."
-
-    local optimized_prompt
-    optimized_prompt=$(ollama run mistral <<EOF
-System: ${system_prompt}
+    local optimized_prompt=""
+    if command -v curl &> /dev/null && command -v jq &> /dev/null; then
+        # Query the already-running daemon directly instead of spawning the CLI client
+        optimized_prompt=$(jq -n --arg model "${OLLAMA_MODEL}" --arg system "${OLLAMA_SYSTEM_PROMPT}" --arg prompt "${input_prompt}" \
+                '{model: $model, system: $system, prompt: $prompt, stream: false}' |
+            curl -sf --max-time 120 "${OLLAMA_API_URL}/api/generate" -H 'Content-Type: application/json' -d @- |
+            jq -r '.response // empty') || optimized_prompt=""
+    else
+        optimized_prompt=$(ollama run "${OLLAMA_MODEL}" <<EOF
+System: ${OLLAMA_SYSTEM_PROMPT}
 
 User: ${input_prompt}
 EOF
-)
-    
+) || optimized_prompt=""
+    fi
+
     if [[ -n "${optimized_prompt}" ]]; then
-        log "✨ Prompt optimized successfully"
+        log "✨ Prompt optimized successfully" >&2
         echo "${optimized_prompt}"
     else
-        warn "Ollama optimization failed, using original prompt"
+        warn "Ollama optimization failed, using original prompt" >&2
         echo "${input_prompt}"
     fi
 }
@@ -136,24 +219,11 @@ check_models() {
     
     local missing_models=()
     
-    # Check flux-kontext model
-    if [[ ! -f "${COMFYUI_DIR}/models/diffusion_models/flux1-dev-kontext_fp8_scaled.safetensors" ]]; then
-        missing_models+=("flux1-dev-kontext_fp8_scaled.safetensors")
-    fi
-    
-    # Check text encoders
-    if [[ ! -f "${COMFYUI_DIR}/models/text_encoders/clip_l.safetensors" ]]; then
-        missing_models+=("clip_l.safetensors")
-    fi
-    
-    if [[ ! -f "${COMFYUI_DIR}/models/text_encoders/t5xxl_fp8_e4m3fn_scaled.safetensors" ]]; then
-        missing_models+=("t5xxl_fp8_e4m3fn_scaled.safetensors")
-    fi
-    
-    # Check VAE
-    if [[ ! -f "${COMFYUI_DIR}/models/vae/ae.safetensors" ]]; then
-        missing_models+=("ae.safetensors")
-    fi
+    for model in "${REQUIRED_MODELS[@]}"; do
+        if [[ ! -f "${model}" ]]; then
+            missing_models+=("${model##*/}")
+        fi
+    done
     
     if [[ ${#missing_models[@]} -gt 0 ]]; then
         warn "Missing models detected:"
@@ -169,27 +239,59 @@ check_models() {
     return 0
 }
 
-install_models() {
-    log "📥 Installing flux-kontext models..."
+download_model() {
+    local dest="$1"
+    local url="$2"
+    local force="${3:-false}"
     
-    mkdir -p "${COMFYUI_DIR}/models/diffusion_models"
-    mkdir -p "${COMFYUI_DIR}/models/text_encoders"
-    mkdir -p "${COMFYUI_DIR}/models/vae"
+    if [[ "${force}" == true ]]; then
+        rm -f -- "${dest}" "${dest}.part"
+    fi
     
-    log "Downloading flux1-dev-kontext_fp8_scaled.safetensors..."
-    wget -O "${COMFYUI_DIR}/models/diffusion_models/flux1-dev-kontext_fp8_scaled.safetensors" \
-        "https://huggingface.co/Comfy-Org/flux1-kontext-dev_ComfyUI/resolve/main/split_files/diffusion_models/flux1-dev-kontext_fp8_scaled.safetensors"
+    # -nv: one line per file, since several downloads share the terminal.
+    if [[ -f "${dest}" ]]; then
+        # Earlier versions wrote straight to the final path, so an existing file may be
+        # truncated. wget -c tops it up, or exits at once if it is already complete.
+        log "Verifying ${dest##*/}..."
+        wget -nv -c -O "${dest}" "${url}"
+        return
+    fi
     
-    log "Downloading text encoders..."
-    wget -O "${COMFYUI_DIR}/models/text_encoders/clip_l.safetensors" \
-        "https://huggingface.co/comfyanonymous/flux_text_encoders/resolve/main/clip_l.safetensors"
+    log "Downloading ${dest##*/}..."
+    # -c into a .part file resumes an interrupted run; only a finished file is renamed into place.
+    wget -nv -c -O "${dest}.part" "${url}" && mv -- "${dest}.part" "${dest}"
+}
+
+install_models() {
+    local force="${1:-false}"
     
-    wget -O "${COMFYUI_DIR}/models/text_encoders/t5xxl_fp8_e4m3fn_scaled.safetensors" \
-        "https://huggingface.co/comfyanonymous/flux_text_encoders/resolve/main/t5xxl_fp8_e4m3fn_scaled.safetensors"
+    log "📥 Installing flux-kontext models..."
     
-    log "Downloading VAE..."
-    wget -O "${COMFYUI_DIR}/models/vae/ae.safetensors" \
-        "https://huggingface.co/Comfy-Org/Lumina_Image_2.0_Repackaged/resolve/main/split_files/vae/ae.safetensors"
+    # One mkdir call for every model directory
+    mkdir -p "${FLUX_KONTEXT_MODEL%/*}" "${CLIP_L_MODEL%/*}" "${VAE_MODEL%/*}"
+    
+    # The downloads are independent and network-bound, so run them concurrently
+    local pids=()
+    download_model "${FLUX_KONTEXT_MODEL}" \
+        "https://huggingface.co/Comfy-Org/flux1-kontext-dev_ComfyUI/resolve/main/split_files/diffusion_models/flux1-dev-kontext_fp8_scaled.safetensors" "${force}" &
+    pids+=($!)
+    download_model "${CLIP_L_MODEL}" \
+        "https://huggingface.co/comfyanonymous/flux_text_encoders/resolve/main/clip_l.safetensors" "${force}" &
+    pids+=($!)
+    download_model "${T5XXL_MODEL}" \
+        "https://huggingface.co/comfyanonymous/flux_text_encoders/resolve/main/t5xxl_fp8_e4m3fn_scaled.safetensors" "${force}" &
+    pids+=($!)
+    download_model "${VAE_MODEL}" \
+        "https://huggingface.co/Comfy-Org/Lumina_Image_2.0_Repackaged/resolve/main/split_files/vae/ae.safetensors" "${force}" &
+    pids+=($!)
+    
+    local failed=0
+    for pid in "${pids[@]}"; do
+        wait "${pid}" || failed=1
+    done
+    if [[ ${failed} -ne 0 ]]; then
+        error "One or more model downloads failed"
+    fi
     
     log "✅ Models installed successfully"
 }
@@ -207,34 +309,26 @@ generate_workflow() {
     local width="${6:-$DEFAULT_WIDTH}"
     local height="${7:-$DEFAULT_HEIGHT}"
     
-    log "🎨 Generating workflow configuration..."
+    log "🎨 Generating workflow configuration..." >&2
     
-    # Copy base workflow
+    local template="${WORKFLOW_DIR}/${FLUX_KONTEXT_BASIC}"
     local workflow_file="${OUTPUT_DIR}/current_workflow.json"
-    cp "${WORKFLOW_DIR}/${FLUX_KONTEXT_BASIC}" "${workflow_file}"
     
-    # Update workflow with parameters using jq
+    # Patch the template in a single jq pass (no copy, no per-field rewrite)
     if command -v jq &> /dev/null; then
-        # Update prompt (Node 6 - CLIPTextEncode)
-        jq --arg prompt "$prompt" '.nodes[] | select(.id == 6) | .widgets_values[0] = $prompt' "${workflow_file}" > "${workflow_file}.tmp"
-        mv "${workflow_file}.tmp" "${workflow_file}"
-        
-        # Update CFG (Node 35 - FluxGuidance) 
-        jq --arg cfg "$cfg" '.nodes[] | select(.id == 35) | .widgets_values[0] = ($cfg | tonumber)' "${workflow_file}" > "${workflow_file}.tmp"
-        mv "${workflow_file}.tmp" "${workflow_file}"
-        
-        # Update seed and steps (Node 31 - KSampler)
-        if [[ "$seed" != "randomize" ]]; then
-            jq --arg seed "$seed" --arg steps "$steps" '.nodes[] | select(.id == 31) | .widgets_values[0] = ($seed | tonumber) | .widgets_values[2] = ($steps | tonumber) | .widgets_values[1] = "fixed"' "${workflow_file}" > "${workflow_file}.tmp"
-            mv "${workflow_file}.tmp" "${workflow_file}"
-        else
-            jq --arg steps "$steps" '.nodes[] | select(.id == 31) | .widgets_values[2] = ($steps | tonumber) | .widgets_values[1] = "randomize"' "${workflow_file}" > "${workflow_file}.tmp"
-            mv "${workflow_file}.tmp" "${workflow_file}"
+        # Runs inside the caller's $(...), where set -e does not apply; fail explicitly so
+        # the assignment aborts instead of handing ComfyUI an empty workflow
+        if ! jq -c --arg prompt "$prompt" --arg cfg "$cfg" --arg seed "$seed" --arg steps "$steps" \
+            "${WORKFLOW_PATCH_FILTER}" "${template}" > "${workflow_file}"; then
+            rm -f -- "${workflow_file}"
+            warn "Failed to patch workflow template (check seed, steps and cfg are numeric)" >&2
+            return 1
         fi
         
-        log "✅ Workflow configured successfully"
+        log "✅ Workflow configured successfully" >&2
     else
-        warn "jq not found. Using template workflow without parameter updates."
+        warn "jq not found. Using template workflow without parameter updates." >&2
+        cp "${template}" "${workflow_file}"
     fi
     
     echo "${workflow_file}"
@@ -251,23 +345,23 @@ run_generation() {
     
     cd "${COMFYUI_DIR}"
     
-    # Activate virtual environment and run ComfyUI
-    source "${VENV_PATH}"
-    
-    python main.py --workflow "${workflow_file}" --output-directory "${OUTPUT_DIR}"
+    # Run ComfyUI with the venv interpreter directly (no activate script per run)
+    "${VENV_PYTHON}" main.py --workflow "${workflow_file}" --output-directory "${OUTPUT_DIR}"
     
     log "✅ Generation completed"
     
-    # Show latest output
+    # Show latest output (newest mtime, found in one pass without sorting)
     local latest_output
-    latest_output=$(find "${OUTPUT_DIR}" -name "*.png" -o -name "*.jpg" -o -name "*.webp" | sort -t '_' -k2 -nr | head -n1)
+    latest_output=$(list_outputs |
+        awk '$1 > newest { newest = $1; latest = substr($0, index($0, " ") + 1) } END { print latest }')
     
     if [[ -n "${latest_output}" ]]; then
         log "📸 Latest output: ${latest_output}"
         
         # Optional: Open with default image viewer
         if command -v xdg-open &> /dev/null; then
-            xdg-open "${latest_output}" 2>/dev/null &
+            # Detach fully so a piped/tee'd comfyctl does not wait on the viewer
+            xdg-open "${latest_output}" > /dev/null 2>&1 &
         fi
     fi
 }
@@ -324,12 +418,18 @@ GENERATE OPTIONS:
   -c, --cfg         CFG guidance scale (default: 2.5)
   -w, --width       Image width (default: 1024)
   -h, --height      Image height (default: 1024)
-  --no-ollama       Skip prompt optimization with Ollama
+  --ollama          Optimize the prompt with Ollama first (default: off)
+  --no-ollama       Skip prompt optimization with Ollama (default)
+
+INSTALL-MODELS OPTIONS:
+  --force           Delete and re-download models that are already present
 
 EXAMPLES:
   $0 generate -p "European supermodel, professional headshot"
   $0 generate -p "Portrait photography" -s 123456 -b 4 -t 30
+  $0 generate -p "Portrait of elegant woman" --ollama
   $0 install-models
+  $0 install-models --force
   $0 smoke-test
 
 Node ID Reference (flux-kontext workflow):
@@ -349,7 +449,7 @@ cmd_generate() {
     local cfg="$DEFAULT_CFG"
     local width="$DEFAULT_WIDTH"
     local height="$DEFAULT_HEIGHT"
-    local use_ollama=true
+    local use_ollama=false
     
     # Parse arguments
     while [[ $# -gt 0 ]]; do
@@ -382,6 +482,10 @@ cmd_generate() {
                 height="$2"
                 shift 2
                 ;;
+            --ollama)
+                use_ollama=true
+                shift
+                ;;
             --no-ollama)
                 use_ollama=false
                 shift
@@ -397,12 +501,12 @@ cmd_generate() {
     fi
     
     # Check dependencies and models
-    check_dependencies
+    check_dependencies "${use_ollama}"
     if ! check_models; then
         error "Required models are missing. Run 'install-models' first."
     fi
     
-    # Optimize prompt if Ollama is available
+    # Optimize prompt only when requested; the LLM round-trip dominates generate startup
     local optimized_prompt="$prompt"
     if [[ "$use_ollama" == true ]]; then
         optimized_prompt=$(optimize_prompt_with_ollama "$prompt")
@@ -432,9 +536,23 @@ cmd_generate() {
 }
 
 cmd_install_models() {
+    local force=false
+    
+    while [[ $# -gt 0 ]]; do
+        case $1 in
+            --force)
+                force=true
+                shift
+                ;;
+            *)
+                error "Unknown option: $1"
+                ;;
+        esac
+    done
+    
     log "🔧 Installing flux-kontext models..."
     check_dependencies
-    install_models
+    install_models "${force}"
     git_commit_milestone "Installed flux-kontext FP8 models"
     log "✅ Model installation completed"
 }
@@ -456,23 +574,18 @@ cmd_smoke_test() {
         error "Models missing. Run 'install-models' first."
     fi
     
-    # Test prompts for European supermodel generation
-    local test_prompts=(
-        "Professional headshot of a European supermodel, studio lighting"
-        "Portrait photography, elegant pose, soft natural lighting"
-        "High fashion model, editorial style, minimalist background"
-    )
+    log "Running ${#SMOKE_TEST_PROMPTS[@]} test generations..."
     
-    log "Running ${#test_prompts[@]} test generations..."
+    # Create the output directory once, not per generated workflow
+    mkdir -p "${OUTPUT_DIR}"
     
-    for i in "${!test_prompts[@]}"; do
-        log "Test $((i+1))/${#test_prompts[@]}: ${test_prompts[$i]}"
+    for i in "${!SMOKE_TEST_PROMPTS[@]}"; do
+        log "Test $((i+1))/${#SMOKE_TEST_PROMPTS[@]}: ${SMOKE_TEST_PROMPTS[$i]}"
         
         local workflow_file
-        workflow_file=$(generate_workflow "${test_prompts[$i]}" "$((123456 + i))" 1 10 2.5 512 512)
+        workflow_file=$(generate_workflow "${SMOKE_TEST_PROMPTS[$i]}" "$((123456 + i))" 1 10 2.5 512 512)
         
         run_generation "$workflow_file"
-        sleep 2  # Brief pause between generations
     done
     
     git_commit_milestone "Completed smoke tests - all systems operational"
@@ -484,12 +597,13 @@ cmd_smoke_test() {
 cmd_clean_old() {
     log "🧹 Safely pruning old files..."
     
-    local output_count
-    output_count=$(find "${OUTPUT_DIR}" -name "*.png" -o -name "*.jpg" -o -name "*.webp" | wc -l)
+    # Newest first by mtime; one listing serves both the count and the prune
+    local outputs=()
+    mapfile -t outputs < <(list_outputs | sort -nr | cut -d' ' -f2-)
     
-    if [[ $output_count -gt 50 ]]; then
-        warn "Found $output_count output files. Keeping latest 50..."
-        find "${OUTPUT_DIR}" -name "*.png" -o -name "*.jpg" -o -name "*.webp" | sort -t '_' -k2 -nr | tail -n +51 | xargs rm -f
+    if [[ ${#outputs[@]} -gt 50 ]]; then
+        warn "Found ${#outputs[@]} output files. Keeping latest 50..."
+        rm -f -- "${outputs[@]:50}"
         log "✅ Old outputs cleaned"
     fi
     
@@ -538,12 +652,19 @@ cmd_status() {
     
     echo "📈 Recent Activity:"
     if [[ -d "${OUTPUT_DIR}" ]]; then
-        local recent_count
-        recent_count=$(find "${OUTPUT_DIR}" -name "*.png" -o -name "*.jpg" -o -name "*.webp" -mtime -1 2>/dev/null | wc -l)
+        # Single directory walk: count last-24h images and track the newest one
+        local now recent_count latest_output
+        printf -v now '%(%s)T' -1
+        {
+            read -r recent_count
+            IFS= read -r latest_output || true
+        } < <(list_outputs |
+            awk -v cutoff="$((now - 86400))" '
+                $1 >= cutoff { recent++ }
+                $1 > newest { newest = $1; latest = substr($0, index($0, " ") + 1) }
+                END { print recent + 0; print latest }')
         echo "  Images generated today: $recent_count"
-        
-        local latest_output
-        latest_output=$(find "${OUTPUT_DIR}" -name "*.png" -o -name "*.jpg" -o -name "*.webp" 2>/dev/null | sort -t '_' -k2 -nr | head -n1)
+
         if [[ -n "$latest_output" ]]; then
             echo "  Latest output: $(basename "$latest_output")"
         fi
@@ -574,7 +695,8 @@ main() {
             cmd_generate "$@"
             ;;
         install-models)
-            cmd_install_models
+            shift
+            cmd_install_models "$@"
             ;;
         check-models)
             cmd_check_models
@@ -10,22 +10,29 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 COMFYUI_DIR="${SCRIPT_DIR}/ComfyUI"
 LORA_DIR="${COMFYUI_DIR}/models/loras"
 
-# Colors for output
-RED='\033[0;31m'
-GREEN='\033[0;32m'
-YELLOW='\033[1;33m'
-NC='\033[0m' # No Color
+# Colors for output (ANSI-C quoted so escapes are resolved once, not per message).
+# Disabled when stdout is not a terminal or NO_COLOR is set.
+if [[ -t 1 && -z "${NO_COLOR:-}" ]]; then
+    RED=$'\033[0;31m'
+    GREEN=$'\033[0;32m'
+    YELLOW=$'\033[1;33m'
+    NC=$'\033[0m' # No Color
+else
+    RED='' GREEN='' YELLOW='' NC=''
+fi
 
 log() {
-    echo -e "${GREEN}[$(date +'%Y-%m-%d %H:%M:%S')] $1${NC}"
+    local timestamp
+    printf -v timestamp '%(%Y-%m-%d %H:%M:%S)T' -1  # builtin, no date(1) fork per line
+    printf '%s\n' "${GREEN}[${timestamp}] $1${NC}"
 }
 
 warn() {
-    echo -e "${YELLOW}[WARNING] $1${NC}"
+    printf '%s\n' "${YELLOW}[WARNING] $1${NC}"
 }
 
 error() {
-    echo -e "${RED}[ERROR] $1${NC}"
+    printf '%s\n' "${RED}[ERROR] $1${NC}"
     exit 1
 }
 